@@ -0,0 +1,66 @@
+"""Shared scaffolding for the example scripts.
+
+Provides pooled tool construction and the run-and-exit-code wrapper used by
+``call_analytics.py`` and ``crm_automation.py``. Heavy imports (strands, httpx,
+and the tool integrations) are deferred until a workflow actually runs, so
+``--help`` and argument errors return without loading them.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List
+
+
+def build_tools(tools_spec: List[str]) -> List[Any]:
+    """Build pooled tools by name, bound to the shared HTTP client.
+
+    Args:
+        tools_spec: Tool names: "hubspot", "hubspot_batch_read"
+
+    Returns:
+        Strands tools
+    """
+    from integrations import get_client, make_hubspot, make_hubspot_batch_read
+
+    factories = {
+        "hubspot": lambda client: [make_hubspot(client)],
+        "hubspot_batch_read": make_hubspot_batch_read,
+    }
+
+    client = get_client()
+    tools = []
+    for name in tools_spec:
+        tools.extend(factories[name](client))
+    return tools
+
+
+def run_workflow(
+    fn: Callable[..., Awaitable[Any]],
+    *args: Any,
+    error_message: str = "Error executing workflow",
+) -> int:
+    """Run an async workflow with the shared HTTP client open.
+
+    Args:
+        fn: Coroutine function to run
+        *args: Arguments passed to ``fn``
+        error_message: Prefix printed when the workflow raises
+
+    Returns:
+        Process exit code (0 on success, 1 on error)
+    """
+
+    async def _run() -> None:
+        from integrations import close_client, open_client
+
+        open_client()
+        try:
+            await fn(*args)
+        finally:
+            await close_client()
+
+    try:
+        asyncio.run(_run())
+        return 0
+    except Exception as e:
+        print(f"❌ {error_message}: {e}")
+        return 1
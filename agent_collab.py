@@ -0,0 +1,177 @@
+"""Two-model planner/executor collaboration for multi-step workflows.
+
+A large planner model turns the workflow prompt into a short JSON plan of tool
+calls, and a small executor model carries the plan out with the tools. When
+the executor stagnates (keeps repeating an identical tool call), the run is
+escalated back to the planner for a revised plan.
+
+Usage:
+    collab = AgentCollab(tools=[hubspot, teams])
+    result = await collab.invoke_async("Generate a daily leads digest ...")
+"""
+
+import json
+import os
+from collections import Counter
+from typing import Any, List, Optional, Union
+
+from strands import Agent
+from strands.hooks import BeforeToolCallEvent, HookProvider, HookRegistry
+from strands.types.content import ContentBlock
+
+MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "bedrock")
+
+# Bedrock executor inference profile; the geography prefix comes from the region
+BEDROCK_EXECUTOR_MODEL_ID = "{}.anthropic.claude-haiku-4-5-20251001-v1:0"
+
+
+def _bedrock_executor_model_id() -> Optional[str]:
+    """Small Bedrock model for the configured region, or None (Strands default) if unknown."""
+    import boto3
+
+    region = boto3.Session().region_name or os.getenv("AWS_REGION") or "us-west-2"
+    prefix = "-".join(region.split("-")[:-2])  # "us-east-1" -> "us", "us-gov-west-1" -> "us-gov"
+    return BEDROCK_EXECUTOR_MODEL_ID.format(prefix) if prefix in {"us", "eu"} else None
+
+
+# Default (planner, executor) model IDs per provider; None uses the Strands default model
+DEFAULT_MODEL_IDS = {
+    "bedrock": (None, _bedrock_executor_model_id() if MODEL_PROVIDER == "bedrock" else None),
+    "anthropic": ("claude-sonnet-4-20250514", "claude-3-5-haiku-20241022"),
+    "openai": ("gpt-4o", "gpt-4o-mini"),
+}
+_planner_default, _executor_default = DEFAULT_MODEL_IDS.get(MODEL_PROVIDER, (None, None))
+PLANNER_MODEL_ID = os.getenv("PLANNER_MODEL_ID", _planner_default)
+EXECUTOR_MODEL_ID = os.getenv("EXECUTOR_MODEL_ID", _executor_default)
+
+PLANNER_PROMPT = """You plan CRM workflows for an executor agent. You cannot call tools.
+
+Reply with ONLY a JSON array of steps, each step an object:
+  {{"tool": "<tool name>", "purpose": "<one line>", "args": {{...}}}}
+Use "tool": null for analysis or summarization steps. Keep the plan short.
+
+Tools available to the executor:
+{tools}
+"""
+
+EXECUTOR_PROMPT = """You execute a JSON plan of tool calls produced by a planner.
+Follow the plan step by step, fill in arguments from earlier results, and do
+not repeat a tool call with identical arguments. Finish with the requested summary."""
+
+
+def create_model(model_id: Optional[str], provider: str = MODEL_PROVIDER) -> Any:
+    """Build a model for ``provider``; Bedrock takes the model ID as is."""
+    if model_id is None:
+        return None
+    if provider == "anthropic":
+        from strands.models.anthropic import AnthropicModel
+
+        return AnthropicModel(model_id=model_id, max_tokens=4096)
+    if provider == "openai":
+        from strands.models.openai import OpenAIModel
+
+        return OpenAIModel(model_id=model_id, params={"max_tokens": 4096})
+    return model_id
+
+
+class StagnationDetector(HookProvider):
+    """Cancel repeated identical tool calls and flag the run as stagnated."""
+
+    def __init__(self, max_repeats: int = 2):
+        self.max_repeats = max_repeats
+        self.calls: Counter = Counter()
+        self.stagnated = False
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(BeforeToolCallEvent, self.check_tool_call)
+
+    def check_tool_call(self, event: BeforeToolCallEvent) -> None:
+        tool_use = event.tool_use
+        key = (tool_use["name"], json.dumps(tool_use.get("input"), sort_keys=True, default=str))
+        self.calls[key] += 1
+        if self.calls[key] > self.max_repeats:
+            self.stagnated = True
+            event.cancel_tool = (
+                "Cancelled: identical tool call repeated. Stop and report what you have so far."
+            )
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.stagnated = False
+
+
+class AgentCollab:
+    """Planner/executor agent pair exposing the ``invoke_async`` interface of ``Agent``."""
+
+    def __init__(
+        self,
+        tools: List[Any],
+        planner_model: Optional[str] = PLANNER_MODEL_ID,
+        executor_model: Optional[str] = EXECUTOR_MODEL_ID,
+        max_escalations: int = 1,
+        hooks: Optional[List[HookProvider]] = None,
+        examples: str = "",
+    ):
+        """Create the planner and executor agents.
+
+        Args:
+            tools: Tools available to the executor
+            planner_model: Model ID for the large planning model (MODEL_PROVIDER)
+            executor_model: Model ID for the small executing model (MODEL_PROVIDER)
+            max_escalations: How many times a stagnated run is sent back to the planner
+            hooks: Extra hook providers for the executor
+            examples: Example tool calls appended to every prompt (see tool_call_memory.py)
+        """
+        tool_list = "\n".join(
+            f"- {t.tool_spec['name']}: {(t.tool_spec['description'].splitlines() or [''])[0]}"
+            for t in tools
+        )
+        self.planner = Agent(
+            model=create_model(planner_model),
+            tools=[],
+            system_prompt=PLANNER_PROMPT.format(tools=tool_list),
+            callback_handler=None,
+        )
+        self.detector = StagnationDetector()
+        self.executor = Agent(
+            model=create_model(executor_model),
+            tools=tools,
+            system_prompt=EXECUTOR_PROMPT,
+            hooks=[self.detector, *(hooks or [])],
+        )
+        self.max_escalations = max_escalations
+        self.examples = examples
+
+    async def invoke_async(self, prompt: Union[str, List[ContentBlock]]) -> Any:
+        """Plan with the large model, then execute with the small model.
+
+        Args:
+            prompt: Workflow instructions as text or content blocks
+
+        Returns:
+            The executor's final AgentResult
+        """
+        blocks = [{"text": prompt}] if isinstance(prompt, str) else list(prompt)
+        if self.examples:
+            blocks.append({"text": self.examples})
+
+        self.planner.messages = []
+        plan = await self.planner.invoke_async(blocks)
+        progress = []
+
+        for attempt in range(self.max_escalations + 1):
+            # Fresh executor history each attempt; earlier progress is carried as its report
+            self.detector.reset()
+            self.executor.messages = []
+            result = await self.executor.invoke_async([*blocks, *progress, {"text": f"Plan:\n{plan}"}])
+            if not self.detector.stagnated or attempt == self.max_escalations:
+                break
+
+            # Escalate: the planner only sees the stall report, not the executor transcript
+            progress = [{"text": f"Progress from the previous attempt:\n{result}"}]
+            plan = await self.planner.invoke_async(
+                "The executor stalled repeating identical tool calls. "
+                f"Its last report was:\n{result}\n\nRevise the plan for the remaining steps."
+            )
+
+        return result
@@ -4,53 +4,43 @@ This example demonstrates how to combine Deepgram, HubSpot, and Teams tools
 to create a complete call analytics and CRM lookup workflow.
 
 Workflow:
-1. Transcribe call recording using Deepgram
-2. Search for contact in HubSpot by phone number
+1. Transcribe call recording using Deepgram (with sentiment and topic detection)
+2. Search for contact in HubSpot by phone number (concurrently with step 1)
 3. Get contact details and history
 4. Send summary notification to Teams with transcript and customer info
 
+Steps 1 and 2 are independent, so they run directly against the APIs with
+asyncio.gather; the agent is only invoked afterwards to synthesize the summary.
+A "processing" card is posted to Teams right away, the summary is streamed to
+the console as it is generated, and the final summary card follows when the
+stream completes.
+
 Usage:
     python call_analytics.py recording.mp3 +1234567890
 """
 
 import argparse
+import asyncio
+import json
 import sys
 from datetime import datetime
 
-from strands import Agent
-from strands_deepgram import deepgram
-from strands_hubspot import hubspot
-from strands_teams import teams
-
-
-def process_call(audio_file: str, phone_number: str) -> None:
-    """Process a call recording through the complete analytics workflow.
-
-    Args:
-        audio_file: Path to audio recording file
-        phone_number: Phone number to search in HubSpot
-    """
-    # Create agent with all tools
-    agent = Agent(tools=[deepgram, hubspot, teams])
-
-    print(f"\n📞 Processing call recording: {audio_file}")
-    print(f"🔍 Searching for contact: {phone_number}\n")
+from _common import build_tools, run_workflow
+from prompt_cache import cached_prompt
 
-    # Complete workflow using agent
-    result = agent(f"""
-    Process this customer call:
+# Static workflow instructions; kept free of run-specific values so the prompt
+# prefix is byte-identical across runs (see prompt_cache.py)
+PROCESS_CALL_PREAMBLE = """
+    Process this customer call. The call has already been transcribed and the
+    caller looked up in HubSpot by phone number; both results are given below.
     
-    1. Transcribe the audio file: {audio_file}
-       - Use speaker diarization
-       - Detect sentiment
-       - Identify topics
+    1. Review the call insights (duration, sentiment, topics) and the transcript
     
-    2. Search HubSpot for contact with phone number: {phone_number}
-       - Try different phone formats (with/without country code)
-       - Get contact details including name, email, and company
+    2. Review the HubSpot contact lookup (all phone formats were already searched)
+       - Use contact details including name, email, and company
        - Get associated deals and recent interactions if available
     
-    3. Send a comprehensive summary to Teams:
+    3. Finish with a comprehensive summary (it is posted to Teams for you):
        - Contact information (name, company, email)
        - Call transcript with speaker labels
        - Call duration and timestamp
@@ -60,7 +50,98 @@ def process_call(audio_file: str, phone_number: str) -> None:
        - Link to contact in HubSpot
     
     Provide a complete summary of all steps.
-    """)
+    """
+
+PROCESS_CALL_TAIL = """Audio file: {audio_file}
+Phone number: {phone_number}
+
+Call insights:
+{insights}
+
+HubSpot contacts matching the phone number:
+{contacts}
+
+Transcript:
+{transcript}
+"""
+
+
+async def process_call(audio_file: str, phone_number: str, no_teams: bool = False) -> None:
+    """Process a call recording through the complete analytics workflow.
+
+    Args:
+        audio_file: Path to audio recording file
+        phone_number: Phone number to search in HubSpot
+        no_teams: Skip the Teams notification step
+    """
+    from strands import Agent
+
+    from integrations import get_client
+    from integrations.compress import flatten_record
+    from integrations.deepgram import call_insights, format_transcript, transcribe
+    from integrations.hubspot import phone_variants, search_contacts_by_phone
+    from integrations.teams import build_card, post_card
+
+    client = get_client()
+
+    # Normalize once in Python instead of having the model retry formats
+    phone_number = phone_variants(phone_number)[0]
+
+    print(f"\n📞 Processing call recording: {audio_file}")
+    print(f"🔍 Searching for contact: {phone_number}\n")
+
+    async def notify(card: dict) -> None:
+        # A Teams failure is reported but never aborts the analysis
+        try:
+            await post_card(client, card)
+        except Exception as e:
+            print(f"⚠️  Teams notification failed: {e}")
+
+    # Post the "processing" card in the background so Teams users see progress
+    progress = None
+    if not no_teams:
+        progress = asyncio.create_task(
+            notify(build_card("⏳ Processing call", f"Call from {phone_number} is being analyzed..."))
+        )
+
+    try:
+        # Transcription and contact lookup have no data dependency; run them concurrently
+        transcription, contacts = await asyncio.gather(
+            transcribe(client, audio_file),
+            search_contacts_by_phone(client, phone_number),
+        )
+
+        # Create agent for the synthesis step, sharing the same connection pool
+        agent = Agent(tools=build_tools(["hubspot"]), callback_handler=None)
+
+        # Stream the summary to the console as it is generated
+        result = None
+        async for event in agent.stream_async(
+            cached_prompt(
+                PROCESS_CALL_PREAMBLE,
+                PROCESS_CALL_TAIL.format(
+                    audio_file=audio_file,
+                    phone_number=phone_number,
+                    insights=json.dumps(call_insights(transcription)),
+                    contacts=json.dumps([flatten_record(c) for c in contacts]),
+                    transcript=format_transcript(transcription),
+                ),
+            )
+        ):
+            if "data" in event:
+                sys.stdout.write(event["data"])
+                sys.stdout.flush()
+            elif "result" in event:
+                result = event["result"]
+    finally:
+        if progress is not None:
+            await progress
+
+    if result is None:
+        raise RuntimeError("Agent stream ended without a result")
+
+    if not no_teams:
+        await notify(build_card("📞 Call Summary", str(result), "good"))
 
     print("\n✅ Call processing completed!")
     print(f"Result summary available in agent response above.")
@@ -88,12 +169,13 @@ def main():
         return 1
 
     # Process the call
-    try:
-        process_call(args.audio_file, args.phone_number)
-        return 0
-    except Exception as e:
-        print(f"❌ Error processing call: {e}")
-        return 1
+    return run_workflow(
+        process_call,
+        args.audio_file,
+        args.phone_number,
+        args.no_teams,
+        error_message="Error processing call",
+    )
 
 
 if __name__ == "__main__":
@@ -9,35 +9,40 @@ Workflows:
 3. Contact Data Audit - Identify contacts with missing information
 4. Company Data Review - Analyze company data quality
 
+Each workflow runs on an AgentCollab pair: a large model plans the tool calls
+and a small model executes them (see agent_collab.py). Reports are collected
+and posted to Teams in a single batched webhook call once all workflows finish.
+
 Usage:
     python crm_automation.py --workflow daily-leads
     python crm_automation.py --workflow deal-report
     python crm_automation.py --workflow contact-audit
+    python crm_automation.py --workflow daily-leads deal-report contact-audit
 """
 
 import argparse
 import sys
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List
 
-from strands import Agent
-from strands_hubspot import hubspot
-from strands_teams import teams
-
-
-def daily_leads_digest(agent: Agent) -> None:
-    """Generate and send daily digest of new qualified leads."""
-    print("📊 Generating daily leads digest...\n")
+from _common import build_tools, run_workflow
+from prompt_cache import cached_prompt
 
-    # Calculate date range
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+if TYPE_CHECKING:
+    from agent_collab import AgentCollab
 
-    result = agent(f"""
+# Static workflow instructions; kept free of run-specific values so the prompt
+# prefix is byte-identical across runs (see prompt_cache.py)
+DAILY_LEADS_PROMPT = """
     Generate a daily leads digest:
     
-    1. Search HubSpot for contacts created since {yesterday}
+    1. Search HubSpot for contacts created since the date given below
        - Lifecycle stage: Marketing Qualified Lead or Sales Qualified Lead
-       - Include: firstname, lastname, email, company, phone, jobtitle
+       - Include: firstname, lastname, email, company, phone, jobtitle,
+         lifecyclestage, hs_lead_status, hs_analytics_source, hubspotscore
        - Get up to 50 contacts
+       - If any properties are missing, use the hubspot_batch_read_contacts tool
+         with the list of ids from step 1; do NOT call hubspot get in a loop
     
     2. For each lead, extract:
        - Name and job title
@@ -51,29 +56,27 @@ def daily_leads_digest(agent: Agent) -> None:
        - Lead source
        - Industry if available
     
-    4. Send a formatted digest to Teams with:
+    4. Finish with a formatted digest (it is posted to Teams for you) with:
        - Total number of new leads
        - Breakdown by category
        - Top 10 highest priority leads
        - Action items for sales team
     
     Provide a summary of the digest.
-    """)
-
-    print("\n✅ Daily leads digest completed!")
+    """
 
+DAILY_LEADS_TAIL = "Created since: {yesterday}\n"
 
-def deal_pipeline_report(agent: Agent) -> None:
-    """Generate deal pipeline analysis report."""
-    print("💼 Generating deal pipeline report...\n")
-
-    result = agent("""
+DEAL_REPORT_PROMPT = """
     Create a deal pipeline analysis report:
     
     1. Search HubSpot for all open deals:
        - Exclude: closedwon, closedlost stages
        - Include: dealname, amount, dealstage, pipeline, closedate, hubspot_owner_id
-       - Get all deals (limit: 200)
+       - Get all deals (up to 200): search with limit 100 and pass the
+         paging.next.after cursor from the first page to fetch the second
+       - If any properties are missing, use the hubspot_batch_read_deals tool
+         with the list of ids from step 1; do NOT call hubspot get in a loop
     
     2. Analyze the pipeline:
        - Total deal value by stage
@@ -84,34 +87,33 @@ def deal_pipeline_report(agent: Agent) -> None:
     
     3. Calculate metrics:
        - Total pipeline value
-       - Weighted pipeline (by stage probability)
+       - Weighted pipeline (using the stage probabilities given below)
        - Average deal cycle time
        - Conversion rates between stages
     
-    4. Send comprehensive report to Teams:
+    4. Finish with a comprehensive report (it is posted to Teams for you):
        - Pipeline overview with visual indicators
        - Stage-by-stage breakdown
        - Deals requiring attention
        - Forecast for current month
     
     Provide executive summary.
-    """)
-
-    print("\n✅ Deal pipeline report completed!")
+    """
 
+DEAL_REPORT_TAIL = "Deal stages and probabilities:\n{stages}\n"
 
-def contact_data_audit(agent: Agent) -> None:
-    """Audit contact records for missing or incomplete data."""
-    print("🔍 Auditing contact records...\n")
-
-    result = agent("""
+CONTACT_AUDIT_PROMPT = """
     Contact data audit workflow:
     
-    1. Search HubSpot for contacts and analyze data quality:
-       - Contacts without company association
-       - Contacts without job title
-       - Contacts without lifecycle stage
-       - Limit to 50 contacts for analysis
+    1. Find contacts with missing data using server-side filters. Run one
+       hubspot search per criterion with a single filter
+       {"propertyName": <property>, "operator": "NOT_HAS_PROPERTY"},
+       properties ["firstname", "lastname", "email"], and limit 50:
+       - Contacts without company association (associatedcompanyid)
+       - Contacts without job title (jobtitle)
+       - Contacts without lifecycle stage (lifecyclestage)
+       Union the results by contact id, noting which fields each one is missing.
+       Do NOT fetch all contacts and inspect them.
     
     2. For each contact, identify gaps:
        - Missing required fields
@@ -125,28 +127,29 @@ def contact_data_audit(agent: Agent) -> None:
        - Suggested lifecycle stages based on available data
        - Priority items for manual data entry
     
-    4. Send audit report to Teams:
+    4. Finish with an audit report (it is posted to Teams for you):
        - Number of contacts analyzed
        - Data quality statistics
        - Top 10 contacts needing updates
        - Recommended actions for CRM team
     
     Provide complete audit summary.
-    """)
-
-    print("\n✅ Contact data audit completed!")
+    """
 
-
-def company_data_review(agent: Agent) -> None:
-    """Review and analyze company data quality."""
-    print("🏢 Reviewing company data...\n")
-
-    result = agent("""
+COMPANY_REVIEW_PROMPT = """
     Company data review workflow:
     
-    1. Search HubSpot for companies:
-       - Get companies with key properties
-       - Limit to 100 for comprehensive analysis
+    1. Find companies with missing data using server-side filters. Run one
+       hubspot search per criterion with a single filter
+       {"propertyName": <property>, "operator": "NOT_HAS_PROPERTY"},
+       properties ["name", "domain"], and limit 100:
+       - Companies without domain (domain)
+       - Companies without industry (industry)
+       - Companies without country (country)
+       - Companies without city (city)
+       Union the results by company id, noting which fields each one is missing.
+       For the duplicate check, run one more search for up to 100 companies
+       with properties ["name", "domain"] only.
     
     2. Analyze data quality issues:
        - Companies with missing domain
@@ -162,16 +165,110 @@ def company_data_review(agent: Agent) -> None:
        - Location data corrections needed
        - Potential duplicate companies to merge
     
-    4. Send analysis report to Teams:
+    4. Finish with an analysis report (it is posted to Teams for you):
        - Data quality statistics
        - Top 20 companies needing updates
        - Priority recommendations
        - Overall data health score
     
     Provide complete analysis summary.
-    """)
+    """
+
+
+async def daily_leads_digest(agent: "AgentCollab") -> str:
+    """Generate daily digest of new qualified leads; returns the report text."""
+    print("📊 Generating daily leads digest...\n")
+
+    # Calculate date range
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    result = await agent.invoke_async(
+        cached_prompt(DAILY_LEADS_PROMPT, DAILY_LEADS_TAIL.format(yesterday=yesterday))
+    )
+
+    print("\n✅ Daily leads digest completed!")
+    return str(result)
+
+
+async def deal_pipeline_report(agent: "AgentCollab") -> str:
+    """Generate deal pipeline analysis report; returns the report text."""
+    print("💼 Generating deal pipeline report...\n")
+
+    from integrations import get_client
+    from integrations.hubspot import format_stage_table, get_pipelines
+
+    # Stage metadata is cached for a day, so the agent never has to fetch it
+    pipelines = await get_pipelines(get_client())
+
+    stages = format_stage_table(pipelines)
+
+    result = await agent.invoke_async(
+        cached_prompt(DEAL_REPORT_PROMPT, DEAL_REPORT_TAIL.format(stages=stages))
+    )
+
+    print("\n✅ Deal pipeline report completed!")
+    return str(result)
+
+
+async def contact_data_audit(agent: "AgentCollab") -> str:
+    """Audit contact records for missing or incomplete data; returns the report text."""
+    print("🔍 Auditing contact records...\n")
+
+    result = await agent.invoke_async(cached_prompt(CONTACT_AUDIT_PROMPT))
+
+    print("\n✅ Contact data audit completed!")
+    return str(result)
+
+
+async def company_data_review(agent: "AgentCollab") -> str:
+    """Review and analyze company data quality; returns the report text."""
+    print("🏢 Reviewing company data...\n")
+
+    result = await agent.invoke_async(cached_prompt(COMPANY_REVIEW_PROMPT))
 
     print("\n✅ Company data review completed!")
+    return str(result)
+
+
+WORKFLOWS = {
+    "daily-leads": ("📊 Daily Leads Digest", daily_leads_digest),
+    "deal-report": ("💼 Deal Pipeline Report", deal_pipeline_report),
+    "contact-audit": ("🔍 Contact Data Audit", contact_data_audit),
+    "company-review": ("🏢 Company Data Review", company_data_review),
+}
+
+
+async def run(workflows: List[str], no_teams: bool = False) -> None:
+    """Run the selected workflows and post their reports to Teams in one batch."""
+    from agent_collab import AgentCollab
+    from integrations import get_client
+    from integrations.teams import build_card, post_batch
+    from tool_call_memory import ToolCallRecorder, examples_block
+
+    cards = []
+    try:
+        for workflow in workflows:
+            title, fn = WORKFLOWS[workflow]
+
+            # Large model plans, small model executes the tool calls; the
+            # previous run's tool calls are replayed as argument examples
+            recorder = ToolCallRecorder(workflow)
+            agent = AgentCollab(
+                tools=build_tools(["hubspot", "hubspot_batch_read"]),
+                hooks=[recorder],
+                examples=examples_block(workflow),
+            )
+            cards.append(build_card(title, await fn(agent)))
+            recorder.save()
+    finally:
+        # Post every finished report together, even if a later workflow failed
+        # A failed post is reported without hiding a workflow error
+        if cards and not no_teams:
+            try:
+                posts = await post_batch(get_client(), cards)
+                print(f"\n📢 Posted {len(cards)} report(s) to Teams in {posts} request(s)")
+            except Exception as e:
+                print(f"\n⚠️  Failed to post reports to Teams: {e}")
 
 
 def main():
@@ -181,9 +278,10 @@ def main():
     )
     parser.add_argument(
         "--workflow",
-        choices=["daily-leads", "deal-report", "contact-audit", "company-review"],
+        choices=list(WORKFLOWS),
+        nargs="+",
         required=True,
-        help="Workflow to execute"
+        help="Workflow(s) to execute; reports are posted to Teams in one batch"
     )
     parser.add_argument(
         "--no-teams",
@@ -193,31 +291,9 @@ def main():
 
     args = parser.parse_args()
 
-    # Create agent
-    tools = [hubspot]
-    if not args.no_teams:
-        tools.append(teams)
-
-    agent = Agent(tools=tools)
-
-    # Execute selected workflow
-    try:
-        if args.workflow == "daily-leads":
-            daily_leads_digest(agent)
-        elif args.workflow == "deal-report":
-            deal_pipeline_report(agent)
-        elif args.workflow == "contact-audit":
-            contact_data_audit(agent)
-        elif args.workflow == "company-review":
-            company_data_review(agent)
-
-        return 0
-
-    except Exception as e:
-        print(f"❌ Error executing workflow: {e}")
-        return 1
+    # Execute selected workflows
+    return run_workflow(run, args.workflow, args.no_teams)
 
 
 if __name__ == "__main__":
     sys.exit(main())
-
@@ -14,13 +14,16 @@ Usage:
 import argparse
 import base64
 import datetime
+import functools
 import os
+import re
 import socket
+import stat
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
-from dotenv import load_dotenv
 from prompt_toolkit import prompt
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 from prompt_toolkit.history import FileHistory
@@ -28,6 +31,12 @@ from rich.console import Console
 from rich.panel import Panel
 from strands import Agent
 from strands.session.file_session_manager import FileSessionManager
+from strands.tools.watcher import ToolWatcher
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
 
 try:
     from strands.telemetry import StrandsTelemetry
@@ -72,20 +81,62 @@ except ImportError:
             from strands.models.bedrock import BedrockModel
             return BedrockModel(model_id="eu.anthropic.claude-sonnet-4-20250514-v1:0")
 
+# One model (and provider client/connection pool) per provider per process
+create_model = functools.lru_cache(maxsize=4)(create_model)
+
 # Import callback handler
 from handlers.callback_handler import callback_handler
 
-# Import community tools (individual packages)
-from strands_deepgram import deepgram
-from strands_hubspot import hubspot
-from strands_teams import teams
-
 console = Console()
 
+# REPL special commands
+EXIT_COMMANDS = frozenset({"exit", "quit", "bye"})
+HELP_COMMAND = "help"
+
+# KEY=value lines of a .env file, used when python-dotenv is not installed.
+# Follows dotenv's rules: quoted values are taken literally (double quotes
+# allow backslash escapes), and in unquoted values a comment needs leading
+# whitespace, so KEY=a#b keeps "a#b"
+_ENV_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?(?P<key>[A-Za-z_][A-Za-z0-9_.]*)[ \t]*=[ \t]*
+    (?:"(?P<double>(?:\\.|[^"\\])*)"|'(?P<single>[^']*)'|(?P<bare>[^"'\s][^\r\n]*?)?)
+    [ \t]*(?:(?<=[ \t"'=])\#[^\r\n]*)?$""",
+    re.X,
+)
+
+_ENV_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\"}
+
+
+def load_env_file(path: Path) -> None:
+    """Load a .env file without overriding variables that are already set.
+
+    Uses python-dotenv when available, otherwise parses the file with
+    ``_ENV_RE`` and warns about lines it cannot parse.
+    """
+    if load_dotenv is not None:
+        load_dotenv(path)
+        return
+    lines = path.read_bytes().decode("utf-8", errors="replace").splitlines()
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        match = _ENV_RE.match(line)
+        if match is None:
+            console.print(f"[yellow]⚠️  Skipping unparsable line {lineno} in {path}[/yellow]")
+            continue
+        if match["double"] is not None:
+            value = re.sub(
+                r"\\(.)", lambda m: _ENV_ESCAPES.get(m[1], m[0]), match["double"]
+            )
+        else:
+            value = match["single"] if match["single"] is not None else match["bare"] or ""
+        os.environ.setdefault(match["key"], value)
+
+
 # Load environment variables
 env_path = Path('.env')
 if env_path.exists():
-    load_dotenv(env_path)
+    load_env_file(env_path)
     console.print(f"[green]✅ Loaded environment from:[/green] {env_path.absolute()}")
 
 # Generate instance ID
@@ -94,41 +145,83 @@ timestamp = str(int(time.time()))
 instance_id = f"demo-agent-{hostname}-{timestamp[-6:]}"
 
 
+# Batch span processor defaults (milliseconds / spans); env values take precedence
+OTEL_BSP_DEFAULTS = {
+    "OTEL_BSP_SCHEDULE_DELAY": "100",
+    "OTEL_BSP_MAX_EXPORT_BATCH_SIZE": "256",
+}
+
+
+# Result of the first setup_otel() call (None until it has run)
+_OTEL_CONFIGURED: Optional[bool] = None
+
+
 def setup_otel() -> None:
-    """Setup OpenTelemetry for Langfuse observability (optional)."""
+    """Setup OpenTelemetry for Langfuse observability (optional).
+
+    Only the first call does any work; later calls (e.g. when the agent is
+    re-created) return immediately instead of probing the environment again
+    and attaching a second exporter.
+    """
+    global _OTEL_CONFIGURED
+    if _OTEL_CONFIGURED is not None:
+        return
+    _OTEL_CONFIGURED = False
+
     if not TELEMETRY_AVAILABLE:
         return
     
     otel_host = os.environ.get("LANGFUSE_HOST")
+    if not otel_host:
+        return
 
-    if otel_host:
-        public_key = os.environ.get("LANGFUSE_PUBLIC_KEY", "")
-        secret_key = os.environ.get("LANGFUSE_SECRET_KEY", "")
+    public_key = os.environ.get("LANGFUSE_PUBLIC_KEY", "")
+    secret_key = os.environ.get("LANGFUSE_SECRET_KEY", "")
 
-        if public_key and secret_key:
-            try:
-                auth_token = base64.b64encode(
-                    f"{public_key}:{secret_key}".encode()
-                ).decode()
-                otel_endpoint = f"{otel_host}/api/public/otel"
+    if public_key and secret_key:
+        try:
+            auth_token = base64.b64encode(
+                f"{public_key}:{secret_key}".encode()
+            ).decode()
+            otel_endpoint = f"{otel_host}/api/public/otel"
+
+            os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = os.environ.get(
+                "OTEL_EXPORTER_OTLP_ENDPOINT", otel_endpoint
+            )
+            os.environ["OTEL_EXPORTER_OTLP_HEADERS"] = os.environ.get(
+                "OTEL_EXPORTER_OTLP_HEADERS", f"Authorization=Basic {auth_token}"
+            )
+
+            # Spans are exported from the BatchSpanProcessor's worker
+            # thread; keep batches small and frequent so the REPL never
+            # waits on a large flush
+            for name, value in OTEL_BSP_DEFAULTS.items():
+                os.environ.setdefault(name, value)
+
+            strands_telemetry = StrandsTelemetry()
+            strands_telemetry.setup_otlp_exporter()
+            _OTEL_CONFIGURED = True
+        except Exception:
+            # Silently fail if observability setup fails
+            pass
 
-                os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = os.environ.get(
-                    "OTEL_EXPORTER_OTLP_ENDPOINT", otel_endpoint
-                )
-                os.environ["OTEL_EXPORTER_OTLP_HEADERS"] = os.environ.get(
-                    "OTEL_EXPORTER_OTLP_HEADERS", f"Authorization=Basic {auth_token}"
-                )
 
-                strands_telemetry = StrandsTelemetry()
-                strands_telemetry.setup_otlp_exporter()
-            except Exception:
-                # Silently fail if observability setup fails
-                pass
+# Cached (expiry timestamp, session ID) for the current local hour
+_SESSION_ID_CACHE: tuple[float, str] = (0.0, "")
 
 
 def get_session_id() -> str:
     """Generate session ID based on current hour."""
-    return f"demo-agent-{datetime.datetime.now().strftime('%Y-%m-%d-%H')}"
+    global _SESSION_ID_CACHE
+    now = time.time()
+    if now < _SESSION_ID_CACHE[0]:
+        return _SESSION_ID_CACHE[1]
+
+    local = time.localtime(now)
+    session_id = "demo-agent-" + time.strftime("%Y-%m-%d-%H", local)
+    hour_start = int(now) - local.tm_min * 60 - local.tm_sec
+    _SESSION_ID_CACHE = (hour_start + 3600, session_id)
+    return session_id
 
 
 def get_history_file() -> str:
@@ -139,33 +232,8 @@ def get_history_file() -> str:
     return str(history_path)
 
 
-def read_prompt_file() -> tuple[str, str]:
-    """Read system prompt from .prompt file if it exists."""
-    prompt_paths = [
-        Path(".prompt"),
-        Path("README.md"),
-    ]
-    for path in prompt_paths:
-        if path.is_file():
-            try:
-                with open(path, encoding="utf-8") as f:
-                    return f.read(), str(path)
-            except Exception:
-                continue
-    return "", ""
-
-
-def construct_system_prompt() -> str:
-    """Construct the system prompt for the demo agent following Strands SDK v1.11.0 patterns."""
-    # Try to load .prompt file first (research-agent pattern)
-    prompt_content, prompt_file = read_prompt_file()
-    
-    if prompt_content:
-        # Use .prompt file as primary source
-        base_prompt = f"[Loaded system prompt from: {prompt_file}]\n\n{prompt_content}"
-    else:
-        # Fallback to inline prompt
-        base_prompt = """You are a demo agent built with Strands Agents SDK v1.11.0, showcasing strands-tools-community capabilities.
+# Inline fallback system prompt (used when no prompt file is found)
+BASE_PROMPT = """You are a demo agent built with Strands Agents SDK v1.11.0, showcasing strands-tools-community capabilities.
 
 Available Tools:
 ===============
@@ -232,20 +300,21 @@ Response Style:
 
 Environment:
 ===========
-- Current Directory: """ + str(Path.cwd()) + """
-- Python Version: """ + sys.version.split()[0] + """
-- Session ID: """ + get_session_id() + """
-- Timestamp: """ + datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """
+"""
+
+BASE_PROMPT_ENVIRONMENT = """- Current Directory: {cwd}
+- Python Version: {python_version}
+- Session ID: {session_id}
+- Timestamp: {timestamp}
 
 Let's help the user explore and use these community tools!"""
-    
-    # Add runtime environment info
-    runtime_info = f"""
+
+RUNTIME_INFO = """
 
 ## 🚀 Runtime Environment:
 - **Hot-Reload**: Custom tools from ./tools/ directory auto-loaded
 - **Session Persistence**: FileSessionManager active
-- **Model Provider**: {os.getenv('MODEL_PROVIDER', 'bedrock')}
+- **Model Provider**: {model_provider}
 - **Observability**: OpenTelemetry/Langfuse ready
 
 ## 💡 Hot-Reload Tool Creation:
@@ -262,11 +331,111 @@ def my_custom_tool(text: str) -> str:
     return f"Processed: {{text}}"
 ```
 """
-    
-    # Combine with environment variable override
-    system_prompt_override = os.getenv("SYSTEM_PROMPT", "")
-    
-    return base_prompt + runtime_info + system_prompt_override
+
+# Candidate system prompt files, in priority order
+PROMPT_PATHS = (Path(".prompt"),)
+
+# README.md is large and mostly not prompt material; only used when opted in
+README_PROMPT_PATH = Path("README.md")
+
+# Static system prompt parts (base, suffix, needs environment section) keyed by
+# prompt file mtimes and the relevant env vars
+_PROMPT_CACHE: dict[tuple, tuple[str, str, bool]] = {}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return the mtime of a regular file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns if stat.S_ISREG(st.st_mode) else None
+
+
+@functools.lru_cache(maxsize=4)
+def _read_prompt(path: str, mtime_ns: int) -> str:
+    """Read a prompt file; cached per (path, mtime) so edits are picked up."""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _prompt_paths() -> tuple[Path, ...]:
+    """Return the prompt files to try, adding README.md if DEMO_AGENT_README_PROMPT is set."""
+    if os.getenv("DEMO_AGENT_README_PROMPT"):
+        return PROMPT_PATHS + (README_PROMPT_PATH,)
+    return PROMPT_PATHS
+
+
+def read_prompt_file() -> tuple[str, str]:
+    """Read system prompt from .prompt file if it exists."""
+    for path in _prompt_paths():
+        mtime_ns = _mtime_ns(path)
+        if mtime_ns is None:
+            continue
+        try:
+            return _read_prompt(str(path), mtime_ns), str(path)
+        except Exception:
+            continue
+    return "", ""
+
+
+def construct_system_prompt() -> str:
+    """Construct the system prompt for the demo agent following Strands SDK v1.11.0 patterns.
+
+    The static parts are cached until a prompt file changes or MODEL_PROVIDER /
+    SYSTEM_PROMPT are changed; the inline prompt's environment section
+    (session ID, timestamp) is filled in on every call.
+    """
+    key = (
+        tuple((path, _mtime_ns(path)) for path in _prompt_paths()),
+        os.getenv("MODEL_PROVIDER"),
+        os.getenv("SYSTEM_PROMPT", ""),
+    )
+    cached = _PROMPT_CACHE.get(key)
+    if cached is None:
+        # Try to load .prompt file first (research-agent pattern)
+        prompt_content, prompt_file = read_prompt_file()
+
+        if prompt_content:
+            # Use .prompt file as primary source
+            base_prompt = f"[Loaded system prompt from: {prompt_file}]\n\n{prompt_content}"
+        else:
+            # Fallback to inline prompt (environment section added below)
+            base_prompt = BASE_PROMPT
+
+        # Add runtime environment info
+        runtime_info = RUNTIME_INFO.format(model_provider=os.getenv('MODEL_PROVIDER', 'bedrock'))
+
+        # Combine with environment variable override
+        system_prompt_override = os.getenv("SYSTEM_PROMPT", "")
+
+        cached = (base_prompt, runtime_info + system_prompt_override, not prompt_content)
+        _PROMPT_CACHE[key] = cached
+
+    base_prompt, suffix, inline = cached
+    environment = ""
+    if inline:
+        environment = BASE_PROMPT_ENVIRONMENT.format(
+            cwd=Path.cwd(),
+            python_version=sys.version.split()[0],
+            session_id=get_session_id(),
+            timestamp=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        )
+    return "".join((base_prompt, environment, suffix))
+
+
+# Tools loaded from ./tools/, keyed by the directory's (file name, mtime) signature
+_TOOLS_DIR_CACHE: dict[tuple, list] = {}
+
+
+def _tools_dir_signature() -> tuple:
+    """Return a (file name, mtime) signature of the .py files in ./tools/."""
+    try:
+        return tuple(
+            sorted((p.name, p.stat().st_mtime_ns) for p in (Path.cwd() / "tools").glob("*.py"))
+        )
+    except OSError:
+        return ()
 
 
 def create_agent(model_provider: str = "bedrock") -> Agent:
@@ -291,13 +460,23 @@ def create_agent(model_provider: str = "bedrock") -> Agent:
         storage_dir=Path.cwd() / "sessions"
     )
 
+    # Import community tools (individual packages) only when building an agent
+    from strands_deepgram import deepgram
+    from strands_hubspot import hubspot
+    from strands_teams import teams
+
+    # Reuse ./tools/ from the last build when no tool file has changed
+    base_tools = [deepgram, hubspot, teams]
+    tools_signature = _tools_dir_signature()
+    dir_tools = _TOOLS_DIR_CACHE.get(tools_signature)
+
     # Create agent with community tools
     agent = Agent(
         model=model,
-        tools=[deepgram, hubspot, teams],
+        tools=base_tools + (dir_tools or []),
         system_prompt=construct_system_prompt(),
         callback_handler=callback_handler,
-        load_tools_from_directory=True,  # Enable hot-reload from ./tools/
+        load_tools_from_directory=dir_tools is None,  # Enable hot-reload from ./tools/
         session_manager=session_manager,
         trace_attributes={
             "session.id": instance_id,
@@ -306,6 +485,15 @@ def create_agent(model_provider: str = "bedrock") -> Agent:
         },
     )
 
+    if dir_tools is None:
+        base_names = {t.tool_name for t in base_tools}
+        _TOOLS_DIR_CACHE[tools_signature] = [
+            t for name, t in agent.tool_registry.registry.items() if name not in base_names
+        ]
+    else:
+        # Skipping the scan also skips the watcher; keep hot-reload working
+        agent.tool_watcher = ToolWatcher(tool_registry=agent.tool_registry)
+
     return agent
 
 
@@ -376,7 +564,8 @@ def main():
     # Priority 1: Piped input
     if not sys.stdin.isatty():
         try:
-            pipe_task = sys.stdin.read().strip()
+            raw = sys.stdin.buffer.read()
+            pipe_task = raw.decode("utf-8", errors="replace").strip() if raw else ""
             if pipe_task:
                 tasks.append(pipe_task)
         except Exception:
@@ -388,19 +577,14 @@ def main():
         if cmd_task:
             tasks.append(cmd_task)
 
-    # Execute collected tasks
+    # Execute collected tasks: the CLI query usually refers to the piped
+    # input, so both go to the agent as one prompt (one model round trip)
     if tasks:
-        for i, task in enumerate(tasks, 1):
-            if len(tasks) > 1:
-                console.print(f"\n[bold]Task {i}/{len(tasks)}:[/bold] {task}")
-            
-            try:
-                result = agent(task)
-                # Result is already printed by callback handler
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
-                continue
-
+        try:
+            agent("\n\n".join(tasks))
+            # Result is already printed by callback handler
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
         return 0
 
     # Interactive mode
@@ -417,15 +601,17 @@ def main():
                 mouse_support=False,
             )
 
+            command = query.strip()
+            if not command:
+                continue
+
             # Handle special commands
-            if query.lower() in ["exit", "quit", "bye"]:
+            command = command.lower()
+            if command in EXIT_COMMANDS:
                 console.print("\n👋 [bold]Goodbye![/bold]")
                 break
 
-            if not query.strip():
-                continue
-
-            if query.lower() == "help":
+            if command == HELP_COMMAND:
                 console.print("""
 [bold cyan]Available Commands:[/bold cyan]
 
@@ -4,15 +4,35 @@ This module provides rich console output for tool calls, streaming events,
 and agent responses, following the research-agent pattern with halo spinners.
 """
 
+import os
+import sys
 import time
-from typing import Any
+from typing import Any, Optional
 
-from colorama import Fore, Style, init
 from halo import Halo
 from rich.console import Console
 
-# Initialize colorama
-init(autoreset=True)
+if os.name == "nt":
+    from colorama import Fore, Style, init
+
+    # Initialize colorama
+    init(autoreset=True)
+else:
+    # POSIX terminals handle ANSI natively, so skip colorama's stream wrapper;
+    # like colorama, emit no escapes when stdout is not a terminal
+    _ANSI = sys.stdout.isatty()
+
+    def _ansi(code: str) -> str:
+        return f"\x1b[{code}m" if _ANSI else ""
+
+    class Fore:
+        WHITE = _ansi("37")
+        GREEN = _ansi("32")
+        RED = _ansi("31")
+        CYAN = _ansi("36")
+
+    class Style:
+        RESET_ALL = _ansi("0")
 
 # Configure spinner
 SPINNERS = {
@@ -30,9 +50,38 @@ TOOL_COLORS = {
     "info": Fore.CYAN,
 }
 
+# Minimum seconds between tool progress redraws
+SPINNER_UPDATE_INTERVAL = 0.05
+
+# Tool input growth (chars) that triggers a progress update regardless of time
+PROGRESS_MIN_CHARS = 64
+
+# Streamed response text color
+STREAM_COLOR = Fore.WHITE
+
+# Flush streamed text at newlines or after this many chunks
+FLUSH_EVERY = 32
+
+
+def _raw_stdout_fd() -> Optional[int]:
+    """Return the stdout file descriptor if streamed text can be written to it directly."""
+    if os.name != "posix":
+        return None
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    return fd if os.isatty(fd) else None
+
 
 class ToolSpinner:
-    """Spinner for tool execution with status updates."""
+    """Spinner for tool execution with status updates.
+
+    The spinner animates only while waiting (before tool input streams in and
+    while the tool runs); during input streaming it is paused and status
+    changes are written as plain text, so the animation thread does not
+    compete with the stream.
+    """
 
     def __init__(self, text: str = "", color: str = TOOL_COLORS["running"]):
         self.spinner = Halo(
@@ -44,38 +93,78 @@ class ToolSpinner:
         )
         self.color = color
         self.current_text = text
+        self.animating = False
+        self._prefix = color
+        self._suffix = Style.RESET_ALL
 
     def start(self, text: str = None):
         if text:
             self.current_text = text
         print()  # Move to new line
-        self.spinner.start(f"{self.color}{self.current_text}{Style.RESET_ALL}")
+        self.resume()
+
+    def resume(self, text: str = None):
+        """(Re)start the spinner animation on the current line."""
+        if text:
+            self.current_text = text
+        self.spinner.start(self._prefix + self.current_text + self._suffix)
+        self.animating = True
+
+    def pause(self):
+        """Stop the animation and keep showing the status as plain text."""
+        self.spinner.stop()
+        self.animating = False
+        self._render()
+
+    def _render(self):
+        self.spinner.clear()
+        sys.stdout.write(self._prefix + self.current_text + self._suffix)
+        sys.stdout.flush()
 
     def update(self, text: str):
+        """Update the status text (callers throttle how often this is called)."""
         self.current_text = text
-        self.spinner.text = f"{self.color}{text}{Style.RESET_ALL}"
+        if self.animating:
+            self.spinner.text = self._prefix + text + self._suffix
+        else:
+            self._render()
 
     def succeed(self, text: str = None):
         if text:
             self.current_text = text
-        self.spinner.succeed(
-            f"{TOOL_COLORS['success']}{self.current_text}{Style.RESET_ALL}"
-        )
+        self.animating = False
+        self.spinner.succeed(TOOL_COLORS["success"] + self.current_text + self._suffix)
 
     def fail(self, text: str = None):
         if text:
             self.current_text = text
-        self.spinner.fail(f"{TOOL_COLORS['error']}{self.current_text}{Style.RESET_ALL}")
+        self.animating = False
+        self.spinner.fail(TOOL_COLORS["error"] + self.current_text + self._suffix)
 
     def info(self, text: str = None):
         if text:
             self.current_text = text
-        self.spinner.info(f"{TOOL_COLORS['info']}{self.current_text}{Style.RESET_ALL}")
+        self.animating = False
+        self.spinner.info(TOOL_COLORS["info"] + self.current_text + self._suffix)
 
     def stop(self):
+        self.animating = False
         self.spinner.stop()
 
 
+class _ToolState:
+    """Progress of a single streaming tool call."""
+
+    __slots__ = ("name", "start_time", "input_size", "last_update_size", "last_update_ts")
+
+    def __init__(self, name: str, start_time: float):
+        self.name = name
+        self.start_time = start_time
+        self.input_size = 0
+        self.last_update_size = 0
+        self.last_update_ts = 0.0
+
+
 class CallbackHandler:
     """Callback handler matching research-agent pattern."""
 
@@ -85,6 +174,45 @@ class CallbackHandler:
         self.current_spinner = None
         self.current_tool = None
         self.tool_histories = {}
+        self._reset = Style.RESET_ALL
+        self._streaming = False
+        self._chunks: list[str] = []
+        self._fd = _raw_stdout_fd()
+
+    def _flush(self) -> None:
+        """Write buffered stream text in one go.
+
+        On a POSIX terminal the bytes go straight to the stdout file
+        descriptor, skipping Python's text stream layer.
+        """
+        text = "".join(self._chunks)
+        self._chunks.clear()
+        if self._fd is None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        sys.stdout.flush()  # keep ordering with anything printed through sys.stdout
+        data = memoryview(text.encode())
+        while data:
+            data = data[os.write(self._fd, data):]
+
+    def _write_stream(self, data: str) -> None:
+        """Buffer a streamed text chunk, flushing at newlines or every FLUSH_EVERY chunks."""
+        if not self._streaming:
+            self._chunks.append(STREAM_COLOR)
+            self._streaming = True
+        self._chunks.append(data)
+        if len(self._chunks) >= FLUSH_EVERY or "\n" in data:
+            self._flush()
+
+    def _end_stream(self, newline: bool = False) -> None:
+        """Reset the stream color and flush any buffered text."""
+        if self._streaming:
+            self._chunks.append(self._reset)
+            self._streaming = False
+        if newline:
+            self._chunks.append("\n")
+        self._flush()
 
     def callback_handler(self, **kwargs: Any) -> None:
         """Main callback handler following research-agent pattern."""
@@ -95,10 +223,9 @@ class CallbackHandler:
 
         # Handle regular output
         if data:
+            self._write_stream(data)
             if complete:
-                print(f"{Fore.WHITE}{data}{Style.RESET_ALL}")
-            else:
-                print(f"{Fore.WHITE}{data}{Style.RESET_ALL}", end="")
+                self._end_stream(newline=True)
 
         # Handle tool input streaming
         if current_tool_use and current_tool_use.get("input"):
@@ -108,6 +235,10 @@ class CallbackHandler:
 
             # Check if this is a new tool execution
             if tool_id != self.current_tool:
+                # Finish any streamed text before the spinner takes the line
+                if self._streaming:
+                    self._end_stream()
+
                 # Stop previous spinner if exists
                 if self.current_spinner:
                     self.current_spinner.stop()
@@ -120,38 +251,55 @@ class CallbackHandler:
                 self.current_spinner.start()
 
                 # Record tool start
-                self.tool_histories[tool_id] = {
-                    "name": tool_name,
-                    "start_time": time.time(),
-                    "input_size": 0,
-                }
-
-            # Update tool progress
-            if tool_id in self.tool_histories:
+                self.tool_histories[tool_id] = _ToolState(tool_name, time.time())
+
+            elif self.current_spinner and self.current_spinner.animating:
+                # Input is streaming; show progress as plain text from here on
+                self.current_spinner.pause()
+
+            # Update tool progress only once a visible change has accumulated
+            history = self.tool_histories.get(tool_id)
+            if history:
                 current_size = len(tool_input)
-                if current_size > self.tool_histories[tool_id]["input_size"]:
-                    self.tool_histories[tool_id]["input_size"] = current_size
-                    if self.current_spinner:
-                        self.current_spinner.update(
-                            f"🛠️  {tool_name}: {current_size} chars"
-                        )
+                if current_size > history.input_size:
+                    history.input_size = current_size
+                    now = time.monotonic()
+                    if (
+                        current_size - history.last_update_size >= PROGRESS_MIN_CHARS
+                        or now - history.last_update_ts >= SPINNER_UPDATE_INTERVAL
+                    ):
+                        history.last_update_size = current_size
+                        history.last_update_ts = now
+                        if self.current_spinner:
+                            self.current_spinner.update(
+                                f"🛠️  {tool_name}: {current_size} chars"
+                            )
 
         # Process messages
+        if message and self._streaming:
+            self._end_stream()
+
         if isinstance(message, dict):
             # Handle assistant messages (tool starts)
             if message.get("role") == "assistant":
-                for content in message.get("content", []):
-                    if isinstance(content, dict):
+                for content in message.get("content", ()):
+                    if type(content) is dict:
                         tool_use = content.get("toolUse")
                         if tool_use:
                             tool_name = tool_use.get("name")
                             if self.current_spinner:
-                                self.current_spinner.info(f"🔧 Starting {tool_name}...")
+                                # Always show the final input size, even if the
+                                # last streamed update was throttled
+                                history = self.tool_histories.get(tool_use.get("toolUseId"))
+                                size = f" ({history.input_size} chars)" if history else ""
+                                self.current_spinner.info(f"🔧 Starting {tool_name}{size}...")
+                                # Animate again while the tool runs
+                                self.current_spinner.resume(f"🛠️  {tool_name}: Running...")
 
             # Handle user messages (tool results)
             elif message.get("role") == "user":
-                for content in message.get("content", []):
-                    if isinstance(content, dict):
+                for content in message.get("content", ()):
+                    if type(content) is dict:
                         tool_result = content.get("toolResult")
                         if tool_result:
                             tool_id = tool_result.get("toolUseId")
@@ -160,14 +308,14 @@ class CallbackHandler:
                             if tool_id in self.tool_histories:
                                 tool_info = self.tool_histories[tool_id]
                                 duration = round(
-                                    time.time() - tool_info["start_time"], 2
+                                    time.time() - tool_info.start_time, 2
                                 )
 
                                 # Prepare message
                                 if status == "success":
-                                    msg = f"{tool_info['name']} completed in {duration}s"
+                                    msg = f"{tool_info.name} completed in {duration}s"
                                 else:
-                                    msg = f"{tool_info['name']} failed after {duration}s"
+                                    msg = f"{tool_info.name} failed after {duration}s"
 
                                 # Update spinner
                                 if self.current_spinner:
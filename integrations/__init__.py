@@ -0,0 +1,18 @@
+"""Pooled-connection helpers shared by the example workflows.
+
+The example scripts call Deepgram, HubSpot, and Teams through these modules so
+that every REST call reuses one ``httpx.AsyncClient``. They are private
+reimplementations, not the ``strands-tools-community`` tools: the HubSpot
+tools cover only ``search``/``get`` and batch reads.
+"""
+
+from .client import close_client, get_client, open_client
+from .hubspot import make_hubspot, make_hubspot_batch_read
+
+__all__ = [
+    "close_client",
+    "get_client",
+    "make_hubspot",
+    "make_hubspot_batch_read",
+    "open_client",
+]
@@ -0,0 +1,32 @@
+"""On-disk JSON cache shared by the example workflows.
+
+Entries live under ``~/.cache/strands`` (override with ``STRANDS_CACHE_DIR``)
+and are written atomically so an interrupted run never leaves a partial file.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_DIR = Path(
+    os.environ.get("STRANDS_CACHE_DIR", Path.home() / ".cache" / "strands")
+).expanduser()
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """Return the cached JSON value at ``path``, or None if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: Path, value: Any) -> None:
+    """Atomically write ``value`` as JSON to ``path``, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(value, f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,57 @@
+"""Shared HTTP client for the example workflows.
+
+Every HubSpot, Teams, and Deepgram request made by the example scripts goes
+through a single pooled ``httpx.AsyncClient`` so that sequential REST calls
+against the same hosts reuse kept-alive connections instead of paying a new
+TCP + TLS handshake per call.
+
+Usage:
+    client = open_client()
+    try:
+        ...
+    finally:
+        await close_client()
+"""
+
+from typing import Optional
+
+import httpx
+
+# Connection pool limits shared by all workflows
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+HTTP_TIMEOUT = 30.0
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def open_client() -> httpx.AsyncClient:
+    """Create the shared client (or return the one already open).
+
+    Must be called from inside the event loop that will use the client.
+
+    Returns:
+        The process-wide pooled AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=HTTP_LIMITS,
+            http2=True,
+            timeout=HTTP_TIMEOUT,
+        )
+    return _client
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, raising if ``open_client`` was not called."""
+    if _client is None or _client.is_closed:
+        raise RuntimeError("HTTP client is not open; call open_client() first")
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client and release pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,124 @@
+"""Prune and compress HubSpot records before they are returned to the agent.
+
+Raw HubSpot responses carry audit metadata (``hs_*`` properties, timestamps,
+archived flags) that the model re-reads on every turn. These helpers flatten
+each record to ``{"id": ..., <property>: <value>}``, drop empty values and
+unrequested ``hs_*`` bookkeeping, reduce records already returned earlier in
+the run to their IDs, and optionally keep only the top-K records by a cheap heuristic score.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Properties that make up a record's display name, in priority order
+NAME_PROPERTIES = ("dealname", "name")
+
+
+def flatten_record(record: Dict[str, Any], keep: Iterable[str] = ()) -> Dict[str, Any]:
+    """Collapse a HubSpot object into a flat dict of non-empty properties.
+
+    Args:
+        record: HubSpot object with ``id`` and ``properties``
+        keep: ``hs_*`` properties to keep because they were explicitly requested
+
+    Returns:
+        Flat record with ``id``, ``name`` (when derivable), and remaining properties
+    """
+    keep = set(keep)
+    properties = record.get("properties") or {}
+    flat: Dict[str, Any] = {"id": record.get("id")}
+
+    full_name = " ".join(
+        p for p in (properties.get("firstname"), properties.get("lastname")) if p
+    )
+    if full_name:
+        flat["name"] = full_name
+    for prop in NAME_PROPERTIES:
+        if properties.get(prop) and "name" not in flat:
+            flat["name"] = properties[prop]
+
+    for key, value in properties.items():
+        if value in (None, "") or key in ("firstname", "lastname", *NAME_PROPERTIES):
+            continue
+        if key.startswith("hs_") and key not in keep:
+            continue
+        flat[key] = value
+    return flat
+
+
+def _score(record: Dict[str, Any]) -> Tuple[float, str]:
+    """Rank deals by amount and everything else by creation recency."""
+    try:
+        amount = float(record.get("amount") or 0)
+    except ValueError:
+        amount = 0.0
+    return amount, record.get("createdate") or ""
+
+
+def compress_results(
+    results: List[Dict[str, Any]],
+    seen: Set[int],
+    keep: Iterable[str] = (),
+    top_k: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Flatten, de-duplicate, and optionally truncate a list of HubSpot objects.
+
+    Args:
+        results: Raw HubSpot objects
+        seen: Hashes of records already returned this run; updated in place
+        keep: ``hs_*`` properties to keep
+        top_k: Keep only the K highest-scoring records (None keeps all)
+
+    Returns:
+        Dict with ``results``, ``already_returned_ids`` for records the agent
+        has already seen, and a short summary when top-K dropped records
+    """
+    digests: Dict[int, Dict[str, Any]] = {}
+    already_returned = []
+    for record in results:
+        flat = flatten_record(record, keep)
+        digest = hash(json.dumps(flat, sort_keys=True, default=str))
+        if digest in seen:
+            already_returned.append(flat["id"])
+        elif digest not in digests:
+            digests[digest] = flat
+
+    records = list(digests.values())
+    compressed: Dict[str, Any] = {"results": records}
+    if already_returned:
+        compressed["already_returned_ids"] = already_returned
+
+    if top_k is not None and len(records) > top_k:
+        records.sort(key=_score, reverse=True)
+        omitted = records[top_k:]
+        compressed["results"] = records[:top_k]
+        compressed["omitted"] = {
+            "count": len(omitted),
+            "amount_total": sum(_score(r)[0] for r in omitted),
+        }
+
+    # Only records the agent actually saw count as already returned
+    kept = {id(r) for r in compressed["results"]}
+    seen.update(d for d, r in digests.items() if id(r) in kept)
+    return compressed
+
+
+def summarize_results(verb: str, object_type: str, compressed: Dict[str, Any]) -> str:
+    """Describe a compressed result, counting returned, already-returned, and omitted records.
+
+    Args:
+        verb: Leading verb, e.g. "Found" or "Retrieved"
+        object_type: HubSpot object type
+        compressed: Output of ``compress_results``
+
+    Returns:
+        One-line summary for the agent
+    """
+    parts = [f"{verb} {len(compressed['results'])} {object_type}"]
+    already_returned = compressed.get("already_returned_ids")
+    if already_returned:
+        parts.append(f"{len(already_returned)} already returned earlier (see already_returned_ids)")
+    omitted = compressed.get("omitted")
+    if omitted:
+        parts.append(f"{omitted['count']} more omitted (see omitted)")
+    return "; ".join(parts)
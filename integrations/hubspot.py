@@ -0,0 +1,455 @@
+"""HubSpot CRM (read-only) tool backed by the shared HTTP client.
+
+Mirrors the ``strands_hubspot.hubspot`` tool interface for the actions used by
+the example workflows, but issues every request through an injected pooled
+``httpx.AsyncClient`` so repeated calls reuse the same connection. Results are
+flattened and pruned (see ``compress.py``) before they reach the agent.
+"""
+
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+import phonenumbers
+from strands import ToolContext, tool
+
+from .cache import CACHE_DIR, read_json, write_json
+from .compress import compress_results, flatten_record, summarize_results
+
+HUBSPOT_BASE_URL = "https://api.hubapi.com"
+
+# Page size for search requests; pass the returned paging.next.after cursor
+# to fetch the next page
+SEARCH_PAGE_SIZE = 100
+
+# Maximum number of inputs HubSpot accepts per batch read request
+BATCH_READ_SIZE = 100
+
+# Deal pipelines change rarely; cache them on disk for a day
+PIPELINE_CACHE_PATH = CACHE_DIR / "hubspot_pipelines.json"
+PIPELINE_CACHE_TTL = 24 * 60 * 60
+
+# invocation_state key holding the records already returned in the current
+# agent invocation (see compress.compress_results)
+SEEN_STATE_KEY = "hubspot_seen"
+
+# Contact properties returned by direct (non-agent) contact lookups
+CONTACT_PROPERTIES = [
+    "firstname",
+    "lastname",
+    "email",
+    "company",
+    "phone",
+    "mobilephone",
+    "jobtitle",
+    "lifecyclestage",
+]
+
+# HubSpot-maintained digits-only copies of phone/mobilephone (national number,
+# no country code), matched regardless of how the number was entered
+SEARCHABLE_PHONE_PROPERTIES = [
+    "hs_searchable_calculated_phone_number",
+    "hs_searchable_calculated_mobile_number",
+]
+
+
+_pipelines: Optional[List[Dict[str, Any]]] = None
+
+
+def _headers(api_key: Optional[str] = None) -> Dict[str, str]:
+    """Build request headers from the given key or HUBSPOT_API_KEY."""
+    api_key = api_key or os.environ.get("HUBSPOT_API_KEY")
+    if not api_key:
+        raise ValueError("HUBSPOT_API_KEY environment variable required")
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+async def search_objects(
+    client: httpx.AsyncClient,
+    object_type: str,
+    filters: Optional[List[Dict]] = None,
+    properties: Optional[List[str]] = None,
+    limit: int = SEARCH_PAGE_SIZE,
+    after: Optional[str] = None,
+    filter_groups: Optional[List[Dict]] = None,
+) -> Dict[str, Any]:
+    """Search CRM objects with filters.
+
+    Args:
+        client: Shared HTTP client
+        object_type: HubSpot object type (contacts, deals, companies, ...)
+        filters: Filter objects with propertyName, operator, value (ANDed)
+        properties: Properties to return
+        limit: Maximum number of results per page
+        after: Paging cursor from a previous response's paging.next.after
+        filter_groups: Filter groups ORed together; overrides ``filters``
+
+    Returns:
+        Raw HubSpot search response
+    """
+    body: Dict[str, Any] = {"limit": limit}
+    if after:
+        body["after"] = after
+    if filter_groups:
+        body["filterGroups"] = filter_groups
+    elif filters:
+        body["filterGroups"] = [{"filters": filters}]
+    if properties:
+        body["properties"] = properties
+
+    response = await client.post(
+        f"{HUBSPOT_BASE_URL}/crm/v3/objects/{object_type}/search",
+        headers=_headers(),
+        json=body,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def phone_variants(phone_number: str) -> List[str]:
+    """Return the formats a phone number is commonly stored in.
+
+    Numbers without a leading ``+`` are parsed against DEFAULT_PHONE_REGION
+    (default "US"). Unparseable input is returned as-is.
+
+    Args:
+        phone_number: Phone number in any format
+
+    Returns:
+        E.164 first, then national and digits-only (with and without
+        country code) variants, de-duplicated
+    """
+    try:
+        parsed = phonenumbers.parse(phone_number, os.environ.get("DEFAULT_PHONE_REGION", "US"))
+    except phonenumbers.NumberParseException:
+        return [phone_number]
+
+    e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    national = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL)
+    digits = e164.lstrip("+")
+    return list(dict.fromkeys([e164, national, digits, str(parsed.national_number)]))
+
+
+def national_number(phone_number: str) -> str:
+    """Return the national number as digits only, e.g. "4155552671".
+
+    Unparseable input falls back to its digits.
+    """
+    try:
+        parsed = phonenumbers.parse(phone_number, os.environ.get("DEFAULT_PHONE_REGION", "US"))
+    except phonenumbers.NumberParseException:
+        return re.sub(r"\D", "", phone_number)
+    return str(parsed.national_number)
+
+
+async def search_contacts_by_phone(
+    client: httpx.AsyncClient,
+    phone_number: str,
+    properties: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Find contacts whose phone or mobile phone matches the given number.
+
+    Matches HubSpot's normalized digits-only phone properties against the
+    national number, so every stored spelling of the number is found in a
+    single search request.
+
+    Args:
+        client: Shared HTTP client
+        phone_number: Phone number to look up
+        properties: Properties to return (default ``CONTACT_PROPERTIES``)
+
+    Returns:
+        Matching HubSpot contacts
+    """
+    national = national_number(phone_number)
+    filter_groups = [
+        {"filters": [{"propertyName": prop, "operator": "EQ", "value": national}]}
+        for prop in SEARCHABLE_PHONE_PROPERTIES
+    ]
+    result = await search_objects(
+        client,
+        "contacts",
+        properties=properties or CONTACT_PROPERTIES,
+        limit=10,
+        filter_groups=filter_groups,
+    )
+    return result.get("results", [])
+
+
+async def get_object(
+    client: httpx.AsyncClient,
+    object_type: str,
+    object_id: str,
+    properties: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Get a specific CRM object by ID."""
+    params = {}
+    if properties:
+        params["properties"] = ",".join(properties)
+
+    response = await client.get(
+        f"{HUBSPOT_BASE_URL}/crm/v3/objects/{object_type}/{object_id}",
+        headers=_headers(),
+        params=params,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def get_pipelines(client: httpx.AsyncClient) -> List[Dict[str, Any]]:
+    """Get deal pipelines and their stages, memoized per process and on disk.
+
+    Args:
+        client: Shared HTTP client
+
+    Returns:
+        HubSpot deal pipelines
+    """
+    global _pipelines
+    if _pipelines is not None:
+        return _pipelines
+
+    cached = read_json(PIPELINE_CACHE_PATH)
+    if cached and time.time() - cached.get("fetched_at", 0) < PIPELINE_CACHE_TTL:
+        _pipelines = cached["results"]
+        return _pipelines
+
+    response = await client.get(f"{HUBSPOT_BASE_URL}/crm/v3/pipelines/deals", headers=_headers())
+    response.raise_for_status()
+    _pipelines = response.json().get("results", [])
+    write_json(PIPELINE_CACHE_PATH, {"fetched_at": time.time(), "results": _pipelines})
+    return _pipelines
+
+
+def format_stage_table(pipelines: List[Dict[str, Any]]) -> str:
+    """Render pipeline stages as a compact table with win probabilities."""
+    lines = ["pipeline | stage id | stage | probability"]
+    for pipeline in pipelines:
+        stages = sorted(pipeline.get("stages", []), key=lambda st: st.get("displayOrder", 0))
+        for stage in stages:
+            probability = stage.get("metadata", {}).get("probability", "")
+            lines.append(f"{pipeline.get('label')} | {stage.get('id')} | {stage.get('label')} | {probability}")
+    return "\n".join(lines)
+
+
+async def batch_read(
+    client: httpx.AsyncClient,
+    object_type: str,
+    ids: List[str],
+    properties: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Read many CRM objects by ID with the batch read endpoint.
+
+    IDs are sent in chunks of ``BATCH_READ_SIZE``, so a 200-record read costs
+    two requests instead of 200.
+
+    Args:
+        client: Shared HTTP client
+        object_type: HubSpot object type (contacts, deals, companies, ...)
+        ids: Object IDs to read
+        properties: Properties to return
+
+    Returns:
+        List of HubSpot objects
+    """
+    results: List[Dict[str, Any]] = []
+    for start in range(0, len(ids), BATCH_READ_SIZE):
+        body: Dict[str, Any] = {
+            "inputs": [{"id": str(object_id)} for object_id in ids[start : start + BATCH_READ_SIZE]]
+        }
+        if properties:
+            body["properties"] = properties
+
+        response = await client.post(
+            f"{HUBSPOT_BASE_URL}/crm/v3/objects/{object_type}/batch/read",
+            headers=_headers(),
+            json=body,
+        )
+        response.raise_for_status()
+        results.extend(response.json().get("results", []))
+    return results
+
+
+def _seen(tool_context: ToolContext) -> Set[int]:
+    """Return the already-returned record hashes for the current agent invocation."""
+    return tool_context.invocation_state.setdefault(SEEN_STATE_KEY, set())
+
+
+def make_hubspot(client: httpx.AsyncClient, top_k: Optional[int] = None):
+    """Create a ``hubspot`` tool bound to the given HTTP client.
+
+    Args:
+        client: Shared HTTP client used for every HubSpot request
+        top_k: Keep only the K highest-scoring search results per call
+            (default from HUBSPOT_TOP_K env; unset keeps all)
+
+    Returns:
+        Strands tool named ``hubspot``
+    """
+    if top_k is None and os.environ.get("HUBSPOT_TOP_K"):
+        top_k = int(os.environ["HUBSPOT_TOP_K"])
+
+    @tool(context=True)
+    async def hubspot(
+        action: str,
+        object_type: str,
+        properties: Optional[List[str]] = None,
+        filters: Optional[List[Dict]] = None,
+        object_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        tool_context: ToolContext = None,
+    ) -> Dict[str, Any]:
+        """Execute READ-ONLY HubSpot CRM operations.
+
+        Args:
+            action: "search" or "get"
+            object_type: HubSpot object type (contacts, companies, deals, tickets, etc.)
+            properties: (Optional) Properties to return
+            filters: (Optional) For search: list of filter objects with propertyName, operator, value
+            object_id: (Optional) For get: the ID of the object to retrieve
+            limit: (Optional) For search: page size, at most 100 (default from env or 100)
+            after: (Optional) For search: paging.next.after cursor from the previous page
+
+        Returns:
+            Dict containing status and response content
+        """
+        if limit is None:
+            limit = int(os.environ.get("HUBSPOT_DEFAULT_LIMIT", SEARCH_PAGE_SIZE))
+        limit = min(limit, SEARCH_PAGE_SIZE)
+
+        try:
+            if action == "search":
+                result = await search_objects(
+                    client, object_type, filters, properties, limit, after
+                )
+                compressed = compress_results(
+                    result.get("results", []), _seen(tool_context), properties or (), top_k
+                )
+                if "total" in result:
+                    compressed["total"] = result["total"]
+                if result.get("paging"):
+                    compressed["paging"] = result["paging"]
+                return {
+                    "status": "success",
+                    "content": [
+                        {"text": summarize_results("Found", object_type, compressed)},
+                        {"json": compressed},
+                    ],
+                }
+
+            if action == "get":
+                if not object_id:
+                    return {
+                        "status": "error",
+                        "content": [{"text": "object_id is required for get action"}],
+                    }
+                result = await get_object(client, object_type, object_id, properties)
+                return {
+                    "status": "success",
+                    "content": [
+                        {"text": f"Retrieved {object_type} ID: {object_id}"},
+                        {"json": flatten_record(result, properties or ())},
+                    ],
+                }
+
+            return {
+                "status": "error",
+                "content": [{"text": f"Unknown action: {action}. Supported actions: search, get"}],
+            }
+
+        except httpx.HTTPStatusError as e:
+            return {
+                "status": "error",
+                "content": [{"text": f"HubSpot API error: {e}"}],
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "content": [{"text": f"HubSpot operation failed: {e}"}],
+            }
+
+    return hubspot
+
+
+def make_hubspot_batch_read(client: httpx.AsyncClient) -> List[Any]:
+    """Create batch read tools for contacts and deals bound to the given client.
+
+    Args:
+        client: Shared HTTP client used for every HubSpot request
+
+    Returns:
+        Strands tools ``hubspot_batch_read_contacts`` and ``hubspot_batch_read_deals``
+    """
+
+    async def _read(
+        object_type: str,
+        ids: List[str],
+        properties: Optional[List[str]],
+        tool_context: ToolContext,
+    ) -> Dict[str, Any]:
+        try:
+            results = await batch_read(client, object_type, ids, properties)
+            compressed = compress_results(results, _seen(tool_context), properties or ())
+            return {
+                "status": "success",
+                "content": [
+                    {"text": summarize_results("Retrieved", object_type, compressed)},
+                    {"json": compressed},
+                ],
+            }
+        except httpx.HTTPStatusError as e:
+            return {
+                "status": "error",
+                "content": [{"text": f"HubSpot API error: {e}"}],
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "content": [{"text": f"HubSpot batch read failed: {e}"}],
+            }
+
+    @tool(context=True)
+    async def hubspot_batch_read_contacts(
+        ids: List[str],
+        properties: Optional[List[str]] = None,
+        tool_context: ToolContext = None,
+    ) -> Dict[str, Any]:
+        """Read many HubSpot contacts by ID in a single batch request.
+
+        Use this instead of calling hubspot get once per contact.
+
+        Args:
+            ids: Contact IDs (e.g. the ids returned by a previous search)
+            properties: (Optional) Contact properties to return
+
+        Returns:
+            Dict containing status and response content
+        """
+        return await _read("contacts", ids, properties, tool_context)
+
+    @tool(context=True)
+    async def hubspot_batch_read_deals(
+        ids: List[str],
+        properties: Optional[List[str]] = None,
+        tool_context: ToolContext = None,
+    ) -> Dict[str, Any]:
+        """Read many HubSpot deals by ID in a single batch request.
+
+        Use this instead of calling hubspot get once per deal.
+
+        Args:
+            ids: Deal IDs (e.g. the ids returned by a previous search)
+            properties: (Optional) Deal properties to return
+
+        Returns:
+            Dict containing status and response content
+        """
+        return await _read("deals", ids, properties, tool_context)
+
+    return [hubspot_batch_read_contacts, hubspot_batch_read_deals]
@@ -0,0 +1,143 @@
+"""Microsoft Teams notifications sent through the shared HTTP client.
+
+Posts adaptive cards to an incoming webhook through an injected pooled
+``httpx.AsyncClient``.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# Adaptive card colors supported by the simple card builder
+CARD_COLORS = {"default", "good", "attention", "warning", "accent"}
+
+# Teams rejects webhook messages larger than ~28 KB
+MAX_PAYLOAD_BYTES = 28000
+
+# Room left for the message envelope around a single card
+ENVELOPE_BYTES = 512
+
+TRUNCATION_MARKER = "\n\n… (truncated)"
+
+
+def build_card(title: str, message: str, color: str = "default") -> Dict[str, Any]:
+    """Build a simple adaptive card with a title and a message body."""
+    return {
+        "type": "AdaptiveCard",
+        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
+        "version": "1.4",
+        "body": [
+            {
+                "type": "TextBlock",
+                "text": title,
+                "weight": "Bolder",
+                "size": "Medium",
+                "color": color if color in CARD_COLORS else "default",
+            },
+            {"type": "TextBlock", "text": message, "wrap": True},
+        ],
+    }
+
+
+def _card_size(card: Dict[str, Any]) -> int:
+    return len(json.dumps(card))
+
+
+def fit_card(card: Dict[str, Any], max_bytes: int = MAX_PAYLOAD_BYTES - ENVELOPE_BYTES) -> Dict[str, Any]:
+    """Shorten the longest TextBlocks of a card until it fits in one webhook message.
+
+    Args:
+        card: Adaptive card content
+        max_bytes: Maximum serialized card size
+
+    Returns:
+        The card itself if it fits, otherwise a truncated copy
+    """
+    if _card_size(card) <= max_bytes:
+        return card
+
+    card = json.loads(json.dumps(card))
+    blocks = [
+        b for b in card.get("body", []) if b.get("type") == "TextBlock" and b.get("text")
+    ]
+    while blocks and _card_size(card) > max_bytes:
+        block = max(blocks, key=lambda b: len(b["text"]))
+        text = block["text"].removesuffix(TRUNCATION_MARKER)
+        excess = _card_size(card) - max_bytes + len(json.dumps(TRUNCATION_MARKER))
+        # Convert the byte excess to characters (escapes take several bytes),
+        # and cut at most half a block per pass so long blocks shrink evenly
+        text_bytes = max(len(json.dumps(text)) - 2, 1)
+        cut = min(-(-excess * len(text) // text_bytes), max(len(text) // 2, 1))
+        if cut >= len(text):
+            block["text"] = TRUNCATION_MARKER.strip()
+            blocks.remove(block)
+        else:
+            block["text"] = text[: len(text) - cut] + TRUNCATION_MARKER
+    return card
+
+
+def wrap_cards(cards: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap adaptive cards in the webhook message envelope."""
+    return {
+        "type": "message",
+        "attachments": [
+            {"contentType": "application/vnd.microsoft.card.adaptive", "content": card}
+            for card in cards
+        ],
+    }
+
+
+async def post_card(
+    client: httpx.AsyncClient,
+    card: Dict[str, Any],
+    webhook_url: Optional[str] = None,
+) -> None:
+    """Post a single adaptive card to the Teams webhook."""
+    webhook_url = webhook_url or os.environ.get("TEAMS_WEBHOOK_URL")
+    if not webhook_url:
+        raise ValueError("TEAMS_WEBHOOK_URL environment variable required")
+
+    response = await client.post(webhook_url, json=wrap_cards([fit_card(card)]))
+    response.raise_for_status()
+
+
+async def post_batch(
+    client: httpx.AsyncClient,
+    cards: List[Dict[str, Any]],
+    webhook_url: Optional[str] = None,
+) -> int:
+    """Post several adaptive cards as attachments of as few webhook messages as possible.
+
+    Cards are packed greedily into messages under ``MAX_PAYLOAD_BYTES``; each
+    message goes out over the same kept-alive client. A card too large for a
+    message on its own is truncated with ``fit_card``.
+
+    Args:
+        client: Shared HTTP client
+        cards: Adaptive card contents
+        webhook_url: Webhook URL (default from TEAMS_WEBHOOK_URL env)
+
+    Returns:
+        Number of webhook requests made
+    """
+    webhook_url = webhook_url or os.environ.get("TEAMS_WEBHOOK_URL")
+    if not webhook_url:
+        raise ValueError("TEAMS_WEBHOOK_URL environment variable required")
+
+    batches: List[List[Dict[str, Any]]] = []
+    size = 0
+    for card in cards:
+        card = fit_card(card)
+        card_size = _card_size(card) + ENVELOPE_BYTES
+        if not batches or size + card_size > MAX_PAYLOAD_BYTES:
+            batches.append([])
+            size = 0
+        batches[-1].append(card)
+        size += card_size
+
+    for batch in batches:
+        response = await client.post(webhook_url, json=wrap_cards(batch))
+        response.raise_for_status()
+    return len(batches)
@@ -0,0 +1,28 @@
+"""Prompt helpers that keep a byte-stable prefix for provider prompt caching.
+
+Workflow prompts are split into a static preamble (instructions, output
+format) and a short dynamic tail (file names, phone numbers, dates). The
+preamble always comes first and is followed by a cache point, so Bedrock and
+Anthropic can reuse the cached prefix and only prefill the tail on later runs.
+"""
+
+from typing import Any, Dict, List
+
+# Cache point content block understood by the Bedrock and Anthropic models
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+
+def cached_prompt(preamble: str, tail: str = "") -> List[Dict[str, Any]]:
+    """Build prompt content blocks with a cache point after the static preamble.
+
+    Args:
+        preamble: Static instructions, identical on every run
+        tail: Run-specific values appended after the cache point
+
+    Returns:
+        Content blocks to pass to ``Agent.invoke_async``
+    """
+    blocks: List[Dict[str, Any]] = [{"text": preamble}, CACHE_POINT]
+    if tail:
+        blocks.append({"text": tail})
+    return blocks
@@ -17,99 +17,44 @@ Usage:
 
 import argparse
 import sys
+from typing import TYPE_CHECKING
 
-from strands import Agent
-from strands_teams import teams
+if TYPE_CHECKING:
+    from strands import Agent
 
+# Prompts are built once at import: a static instruction head followed by a
+# short tail holding the per-call values, so the prompt prefix never changes
+SIMPLE_NOTIFICATION_PROMPT = """
+    Send a Teams notification using the notification template with these values:
+"""
 
-def send_simple_notification(agent: Agent, title: str, message: str, color: str = "default") -> None:
-    """Send a simple notification to Teams.
-
-    Args:
-        agent: Strands Agent instance
-        title: Notification title
-        message: Notification message
-        color: Color scheme (default, good, attention, warning)
-    """
-    print(f"📢 Sending notification: {title}\n")
-
-    result = agent(f"""
-    Send a Teams notification:
-    - Title: {title}
+SIMPLE_NOTIFICATION_TAIL = """    - Title: {title}
     - Message: {message}
     - Color: {color}
-    
-    Use the notification template.
-    """)
-
-    print("\n✅ Notification sent!")
-
-
-def send_approval_request(agent: Agent, title: str, details: str) -> None:
-    """Send an approval request to Teams.
-
-    Args:
-        agent: Strands Agent instance
-        title: Approval request title
-        details: Detailed description
-    """
-    print(f"✋ Sending approval request: {title}\n")
+"""
 
-    # Generate approval URLs (in real scenario, these would be actual endpoints)
-    approve_url = "https://example.com/approve/123"
-    reject_url = "https://example.com/reject/123"
+APPROVAL_REQUEST_PROMPT = """
+    Send an approval request to Teams using the approval template with action
+    buttons and these values:
+"""
 
-    result = agent(f"""
-    Send an approval request to Teams:
-    - Title: {title}
+APPROVAL_REQUEST_TAIL = """    - Title: {title}
     - Details: {details}
     - Approve URL: {approve_url}
     - Reject URL: {reject_url}
-    
-    Use the approval template with action buttons.
-    """)
-
-    print("\n✅ Approval request sent!")
-
-
-def send_status_update(agent: Agent, project: str, status: str, details: str) -> None:
-    """Send a project status update to Teams.
-
-    Args:
-        agent: Strands Agent instance
-        project: Project name
-        status: Current status
-        details: Status details
-    """
-    print(f"📊 Sending status update for: {project}\n")
+"""
 
-    # Determine color based on status
-    status_colors = {
-        "completed": "good",
-        "in progress": "accent",
-        "on hold": "warning",
-        "blocked": "attention",
-    }
-    color = status_colors.get(status.lower(), "default")
+STATUS_UPDATE_PROMPT = """
+    Send a status update to Teams using the status template with these values:
+"""
 
-    result = agent(f"""
-    Send a status update to Teams:
-    - Project: {project}
+STATUS_UPDATE_TAIL = """    - Project: {project}
     - Status: {status}
     - Details: {details}
     - Color: {color}
-    
-    Use the status template.
-    """)
-
-    print("\n✅ Status update sent!")
-
-
-def send_custom_card(agent: Agent) -> None:
-    """Send a custom adaptive card with rich content."""
-    print("🎨 Sending custom adaptive card...\n")
+"""
 
-    result = agent("""
+CUSTOM_CARD_PROMPT = """
     Send a custom adaptive card to Teams with:
     
     1. Header section:
@@ -137,16 +82,9 @@ def send_custom_card(agent: Agent) -> None:
        - Generated timestamp
     
     Make it visually appealing with proper spacing and formatting.
-    """)
-
-    print("\n✅ Custom card sent!")
-
-
-def send_daily_digest(agent: Agent) -> None:
-    """Send a daily digest with multiple sections."""
-    print("📰 Sending daily digest...\n")
+    """
 
-    result = agent("""
+DAILY_DIGEST_PROMPT = """
     Create and send a comprehensive daily digest to Teams:
     
     Title: "Daily Sales Digest - [Today's Date]"
@@ -180,7 +118,94 @@ def send_daily_digest(agent: Agent) -> None:
        - Deadlines: [count]
     
     Use good color scheme and include action button to "View Full Dashboard"
-    """)
+    """
+
+
+def send_simple_notification(agent: "Agent", title: str, message: str, color: str = "default") -> None:
+    """Send a simple notification to Teams.
+
+    Args:
+        agent: Strands Agent instance
+        title: Notification title
+        message: Notification message
+        color: Color scheme (default, good, attention, warning)
+    """
+    print(f"📢 Sending notification: {title}\n")
+
+    result = agent(
+        SIMPLE_NOTIFICATION_PROMPT
+        + SIMPLE_NOTIFICATION_TAIL.format(title=title, message=message, color=color)
+    )
+
+    print("\n✅ Notification sent!")
+
+
+def send_approval_request(agent: "Agent", title: str, details: str) -> None:
+    """Send an approval request to Teams.
+
+    Args:
+        agent: Strands Agent instance
+        title: Approval request title
+        details: Detailed description
+    """
+    print(f"✋ Sending approval request: {title}\n")
+
+    # Generate approval URLs (in real scenario, these would be actual endpoints)
+    approve_url = "https://example.com/approve/123"
+    reject_url = "https://example.com/reject/123"
+
+    result = agent(
+        APPROVAL_REQUEST_PROMPT
+        + APPROVAL_REQUEST_TAIL.format(
+            title=title, details=details, approve_url=approve_url, reject_url=reject_url
+        )
+    )
+
+    print("\n✅ Approval request sent!")
+
+
+def send_status_update(agent: "Agent", project: str, status: str, details: str) -> None:
+    """Send a project status update to Teams.
+
+    Args:
+        agent: Strands Agent instance
+        project: Project name
+        status: Current status
+        details: Status details
+    """
+    print(f"📊 Sending status update for: {project}\n")
+
+    # Determine color based on status
+    status_colors = {
+        "completed": "good",
+        "in progress": "accent",
+        "on hold": "warning",
+        "blocked": "attention",
+    }
+    color = status_colors.get(status.lower(), "default")
+
+    result = agent(
+        STATUS_UPDATE_PROMPT
+        + STATUS_UPDATE_TAIL.format(project=project, status=status, details=details, color=color)
+    )
+
+    print("\n✅ Status update sent!")
+
+
+def send_custom_card(agent: "Agent") -> None:
+    """Send a custom adaptive card with rich content."""
+    print("🎨 Sending custom adaptive card...\n")
+
+    result = agent(CUSTOM_CARD_PROMPT)
+
+    print("\n✅ Custom card sent!")
+
+
+def send_daily_digest(agent: "Agent") -> None:
+    """Send a daily digest with multiple sections."""
+    print("📰 Sending daily digest...\n")
+
+    result = agent(DAILY_DIGEST_PROMPT)
 
     print("\n✅ Daily digest sent!")
 
@@ -210,7 +235,10 @@ def main():
 
     args = parser.parse_args()
 
-    # Create agent with teams tool
+    # Create agent with teams tool (imported here so --help stays fast)
+    from strands import Agent
+    from strands_teams import teams
+
     agent = Agent(tools=[teams])
 
     # Execute based on notification type
@@ -0,0 +1,104 @@
+"""Cross-run memory of tool calls, replayed as examples on the next run.
+
+Each CRM workflow issues structurally near-identical tool calls every day.
+``ToolCallRecorder`` stores the last successful calls of a run under
+``~/.cache/strands/specdec/<workflow>.jsonl``; on the next run
+``examples_block`` turns them into a prompt block the model can copy argument
+shapes from. Run-specific values (dates, paging cursors, record IDs) are
+replaced with placeholders before saving, so stale values are never replayed.
+
+Bedrock and Anthropic have no predicted-output parameter. OpenAI's
+``prediction`` only speeds up plain text completions and cannot be combined
+with tool calling, which these workflows depend on. A prompt example is
+therefore the one form of the hint that works with every provider.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from strands.hooks import AfterToolCallEvent, HookProvider, HookRegistry
+
+from integrations.cache import CACHE_DIR
+
+SPECDEC_DIR = CACHE_DIR / "specdec"
+
+# Number of tool calls remembered per workflow
+MAX_EXAMPLES = 8
+
+# Argument keys whose values are specific to one run
+CURSOR_KEYS = {"after"}
+ID_KEYS = {"id", "ids", "object_id"}
+
+# ISO dates/datetimes and epoch-millisecond timestamps
+DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2}([T ][\d:.]+Z?)?|\d{13})$")
+
+
+def template_input(value: Any, key: Optional[str] = None) -> Any:
+    """Replace run-specific values in tool arguments with placeholders."""
+    if isinstance(value, dict):
+        return {k: template_input(v, k) for k, v in value.items()}
+    if key in CURSOR_KEYS:
+        return "<cursor>"
+    if key in ID_KEYS:
+        return ["<id>"] if isinstance(value, list) else "<id>"
+    if isinstance(value, list):
+        return [template_input(v) for v in value]
+    if isinstance(value, (str, int)) and DATE_RE.match(str(value)):
+        return "<date>"
+    return value
+
+
+def load_examples(workflow: str) -> List[Dict[str, Any]]:
+    """Load the tool calls recorded by the previous run of a workflow."""
+    path = SPECDEC_DIR / f"{workflow}.jsonl"
+    try:
+        with open(path, encoding="utf-8") as f:
+            # Template again so files written before templating stay safe
+            return [template_input(json.loads(line)) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return []
+
+
+def examples_block(workflow: str) -> str:
+    """Format the previous run's tool calls as a prompt block ("" if none)."""
+    examples = load_examples(workflow)
+    if not examples:
+        return ""
+    lines = "\n".join(json.dumps(example, sort_keys=True) for example in examples)
+    return (
+        "Tool calls from the previous run of this workflow "
+        "(reuse the same argument shapes where they fit; replace <date>, "
+        f"<cursor>, and <id> placeholders with this run's values):\n{lines}\n"
+    )
+
+
+class ToolCallRecorder(HookProvider):
+    """Record successful tool calls of a workflow run for the next run."""
+
+    def __init__(self, workflow: str):
+        self.workflow = workflow
+        self.calls: List[Dict[str, Any]] = []
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(AfterToolCallEvent, self.record)
+
+    def record(self, event: AfterToolCallEvent) -> None:
+        if event.exception or event.result.get("status") != "success":
+            return
+        call = {
+            "name": event.tool_use["name"],
+            "input": template_input(event.tool_use.get("input")),
+        }
+        if call not in self.calls:
+            self.calls.append(call)
+
+    def save(self) -> None:
+        """Persist the last ``MAX_EXAMPLES`` calls, replacing the previous run's."""
+        if not self.calls:
+            return
+        SPECDEC_DIR.mkdir(parents=True, exist_ok=True)
+        path = SPECDEC_DIR / f"{self.workflow}.jsonl"
+        with open(path, "w", encoding="utf-8") as f:
+            for call in self.calls[-MAX_EXAMPLES:]:
+                f.write(json.dumps(call, sort_keys=True, default=str) + "\n")